@@ -1,6 +1,4 @@
 import copy
-import inspect
-import asyncio
 import functools
 
 from typing import Any, Dict, Optional, Sequence
@@ -10,28 +8,34 @@ import pytest
 from _pytest import fixtures
 from _pytest import nodes
 
+from .plugin import _get_plugin_loop, _isasyncgenfunction, _iscoroutinefunction
+
 
 @pytest.hookimpl(specname="pytest_fixture_setup", tryfirst=True)
 def pytest_fixture_setup_wrap_async(
     fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest
 ) -> None:
-    _wrap_async_fixture(fixturedef)
+    _wrap_async_fixture(fixturedef, request.config)
 
 
-def _wrap_async_fixture(fixturedef: pytest.FixtureDef) -> None:
+def _wrap_async_fixture(fixturedef: pytest.FixtureDef, config: pytest.Config) -> None:
     """Wraps the fixture function of an async fixture in a synchronous function."""
-    if inspect.isasyncgenfunction(fixturedef.func):
-        _wrap_asyncgen_fixture(fixturedef)
-    elif inspect.iscoroutinefunction(fixturedef.func):
-        _wrap_asyncfunc_fixture(fixturedef)
+    # Wrapping mutates the FixtureDef, skip inspecting the wrapper on following setups.
+    if getattr(fixturedef.func, "_pytest_asyncio_concurrent_wrapped", False):
+        return
+
+    if _isasyncgenfunction(fixturedef.func):
+        _wrap_asyncgen_fixture(fixturedef, config)
+    elif _iscoroutinefunction(fixturedef.func):
+        _wrap_asyncfunc_fixture(fixturedef, config)
 
 
-def _wrap_asyncgen_fixture(fixturedef: pytest.FixtureDef) -> None:
+def _wrap_asyncgen_fixture(fixturedef: pytest.FixtureDef, config: pytest.Config) -> None:
     fixtureFunc = fixturedef.func
 
     @functools.wraps(fixtureFunc)
     def _asyncgen_fixture_wrapper(**kwargs: Any):
-        event_loop = asyncio.new_event_loop()
+        event_loop = _get_plugin_loop(config)
         gen_obj = fixtureFunc(**kwargs)
 
         async def setup():
@@ -52,15 +56,16 @@ def _wrap_asyncgen_fixture(fixturedef: pytest.FixtureDef) -> None:
         yield result
         event_loop.run_until_complete(teardown())
 
+    _asyncgen_fixture_wrapper._pytest_asyncio_concurrent_wrapped = True  # type: ignore
     fixturedef.func = _asyncgen_fixture_wrapper  # type: ignore[misc]
 
 
-def _wrap_asyncfunc_fixture(fixturedef: pytest.FixtureDef) -> None:
+def _wrap_asyncfunc_fixture(fixturedef: pytest.FixtureDef, config: pytest.Config) -> None:
     fixtureFunc = fixturedef.func
 
     @functools.wraps(fixtureFunc)
     def _async_fixture_wrapper(**kwargs: Dict[str, Any]):
-        event_loop = asyncio.get_event_loop()
+        event_loop = _get_plugin_loop(config)
 
         async def setup():
             res = await fixtureFunc(**kwargs)
@@ -68,6 +73,7 @@ def _wrap_asyncfunc_fixture(fixturedef: pytest.FixtureDef) -> None:
 
         return event_loop.run_until_complete(setup())
 
+    _async_fixture_wrapper._pytest_asyncio_concurrent_wrapped = True  # type: ignore
     fixturedef.func = _async_fixture_wrapper  # type: ignore[misc]
 
 
@@ -105,6 +111,11 @@ def pytest_sessionstart_cache_fixture(session: pytest.Session):
         argname: str,
         node: nodes.Node,
     ) -> Optional[Sequence[pytest.FixtureDef[Any]]]:
+        # Only nodes marked with asyncio_concurrent can share function scoped fixtures
+        # with others running concurrently, the rest keep using the original FixtureDef.
+        if node.get_closest_marker("asyncio_concurrent") is None:
+            return getfixturedefs_original(argname, node)
+
         if fixture_cache_key not in node.stash:
             node.stash[fixture_cache_key] = {}
 
@@ -113,7 +124,7 @@ def pytest_sessionstart_cache_fixture(session: pytest.Session):
             fixtureDefs = getfixturedefs_original(argname, node)
 
             if fixtureDefs:
-                fixtureDefs = tuple(_clone_function_fixture(fixDef) for fixDef in fixtureDefs)
+                fixtureDefs = tuple(map(_clone_function_fixture, fixtureDefs))
 
             cache[argname] = fixtureDefs
 
@@ -127,6 +138,7 @@ def _clone_function_fixture(fixtureDef: pytest.FixtureDef) -> pytest.FixtureDef:
         return fixtureDef
 
     new_fixdef = copy.copy(fixtureDef)
+    new_fixdef.cached_result = None
     if hasattr(fixtureDef, "_finalizers"):
         new_fixdef._finalizers = []  # type: ignore
     else:
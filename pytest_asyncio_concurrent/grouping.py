@@ -58,15 +58,9 @@ class AsyncioConcurrentGroup(pytest.Function):
         pass
 
     def add_child(self, item: "AsyncioConcurrentGroupMember") -> None:
-        child_parent = list(item.iter_parents())[1]
-
-        if child_parent is not self.parent:
+        # Children get skipped in batch before the group runs, if not from same parent.
+        if item.parent is not self.parent:
             self.children_have_same_parent = False
-            for child in self.children:
-                child.add_marker("skip")
-
-        if not self.children_have_same_parent:
-            item.add_marker("skip")
 
         item.group = self
         self.children.append(item)
@@ -87,7 +81,9 @@ class AsyncioConcurrentGroup(pytest.Function):
             raise exceptions[0]
         elif len(exceptions) > 1:
             msg = f"errors while tearing down {item!r}"
-            raise BaseExceptionGroup(msg, exceptions[::-1])
+            # same order as pytest `SetupState` reporting, reversing in place to skip a copy.
+            exceptions.reverse()
+            raise BaseExceptionGroup(msg, exceptions)
 
     def remove_child(self, item: "AsyncioConcurrentGroupMember") -> None:
         assert item in self.children
@@ -104,10 +100,18 @@ class AsyncioConcurrentGroupMember(pytest.Function):
 
     group: AsyncioConcurrentGroup
     _inner: pytest.Function
+    is_asyncio_concurrent_member = True
 
     @staticmethod
-    def promote_from_function(item: pytest.Function) -> "AsyncioConcurrentGroupMember":
-        AsyncioConcurrentGroupMember._refresh_function_scoped_fixture(item)
+    def promote_from_function(
+        item: pytest.Function, own_fixture: bool = False
+    ) -> "AsyncioConcurrentGroupMember":
+        """
+        `own_fixture` indicates the item is the only member using the FixtureDefs resolved on
+        its definition, which saves the fixture refreshing.
+        """
+        if not own_fixture:
+            AsyncioConcurrentGroupMember._refresh_function_scoped_fixture(item)
         member = AsyncioConcurrentGroupMember.from_parent(
             name=item.name,
             parent=item.parent,
@@ -138,10 +142,11 @@ class AsyncioConcurrentGroupMember(pytest.Function):
             "funcmanage"
         )  # type: ignore
 
+        params = item.callspec.params
         new_name2fixturedefs = {}
-        for name in item._fixtureinfo.name2fixturedefs.keys():
-            if name in item.callspec.params.keys():
-                new_name2fixturedefs[name] = item._fixtureinfo.name2fixturedefs[name]
+        for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items():
+            if name in params:
+                new_name2fixturedefs[name] = fixturedefs
             else:
                 new_name2fixturedefs[name] = fixtureManager.getfixturedefs(
                     name, item
@@ -2,10 +2,12 @@ import asyncio
 import bdb
 import functools
 import inspect
+import operator
 import warnings
 import sys
 import contextlib
 
+from pathlib import Path
 from typing import (
     Any,
     Callable,
@@ -14,8 +16,10 @@ from typing import (
     Literal,
     Optional,
     Coroutine,
+    ContextManager,
     Dict,
     Sequence,
+    Tuple,
     Union,
     cast,
 )
@@ -39,6 +43,11 @@ if sys.version_info < (3, 11):
 # =========================== # Config # =========================== #
 
 asyncio_concurrent_group_key = pytest.StashKey[Dict[str, AsyncioConcurrentGroup]]()
+asyncio_concurrent_loop_key = pytest.StashKey[asyncio.AbstractEventLoop]()
+asyncio_concurrent_previous_loop_key = pytest.StashKey[Optional[asyncio.AbstractEventLoop]]()
+asyncio_concurrent_mark_key = pytest.StashKey[Optional[pytest.Mark]]()
+HookWrappers = List[Tuple[Callable[..., ContextManager[Any]], Tuple[str, ...]]]
+hook_wrappers_key = pytest.StashKey[Dict[Tuple[str, Path], HookWrappers]]()
 GroupStrategy = Literal["self", "parent"]
 
 
@@ -55,6 +64,18 @@ def pytest_addoption(parser: pytest.Parser):
             please refer to documentation for more info.",
         default="self",
     )
+    parser.addoption(
+        "--use-uvloop",
+        action="store_true",
+        default=None,
+        help="asyncio-concurrent: run async tests and fixtures on uvloop.",
+    )
+    parser.addini(
+        "use_uvloop",
+        "asyncio-concurrent: run async tests and fixtures on uvloop.",
+        type="bool",
+        default=False,
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -63,6 +84,33 @@ def pytest_configure(config: pytest.Config) -> None:
         "asyncio_concurrent(group, timeout): " "mark the async tests to run concurrently",
     )
     config.stash[asyncio_concurrent_group_key] = {}
+    config.stash[hook_wrappers_key] = {}
+
+    if _use_uvloop(config):
+        try:
+            import uvloop  # noqa: F401
+        except ImportError:
+            raise pytest.UsageError(
+                "asyncio-concurrent: use_uvloop is set, but uvloop is not installed."
+            )
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    loop = config.stash.get(asyncio_concurrent_loop_key, None)
+    if loop is None:
+        return
+
+    # the loop might already be closed by others, e.g. pytest-asyncio.
+    if not loop.is_closed():
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+    previous_loop = config.stash[asyncio_concurrent_previous_loop_key]
+    if previous_loop is not None and previous_loop.is_closed():
+        previous_loop = None
+    asyncio.set_event_loop(previous_loop)
 
 
 @pytest.hookimpl
@@ -85,42 +133,52 @@ MakeItemResult = Union[
 def pytest_pycollect_makeitem_make_group_and_member(
     collector: pytest.Collector, name: str, obj: object
 ) -> Generator[None, MakeItemResult, MakeItemResult]:
-    ori_result = yield
-    if ori_result is None:
+    result = yield
+    if result is None:
         return None
-    if not isinstance(ori_result, list):
-        ori_result = [ori_result]
-
-    result = []
-    for item_or_collector in ori_result:
-        if (
-            not isinstance(item_or_collector, pytest.Function)
-            or _get_asyncio_concurrent_mark(item_or_collector) is None
-        ):
-            result.append(item_or_collector)
+    if not isinstance(result, list):
+        result = [result]
+
+    # Parametrized functions from same definition share the FixtureDefs resolved on it,
+    # the first member can own them as long as they are not shared with others.
+    fixture_owned = False
+    for idx, item_or_collector in enumerate(result):
+        if not isinstance(item_or_collector, pytest.Function):
             continue
 
         item = item_or_collector
+        mark = _get_asyncio_concurrent_mark(item)
+        if mark is None:
+            continue
 
-        item = AsyncioConcurrentGroupMember.promote_from_function(item)
-        result.append(item)
+        own_fixture = not fixture_owned and _is_marked_on_definition(item)
+        fixture_owned = fixture_owned or own_fixture
+        member = AsyncioConcurrentGroupMember.promote_from_function(item, own_fixture=own_fixture)
+        # member carries the same markers as the function it promoted from.
+        member.stash[asyncio_concurrent_mark_key] = mark
+        # replace in place, results without concurrent tests are returned untouched.
+        result[idx] = member
 
     return result
 
 
 @pytest.hookimpl(specname="pytest_itemcollected")
 def pytest_itemcollected_register_in_group(item: pytest.Item) -> None:
-    if not isinstance(item, AsyncioConcurrentGroupMember):
+    if not _is_asyncio_concurrent_member(item):
         return
+    item = cast(AsyncioConcurrentGroupMember, item)
 
     known_groups = item.config.stash[asyncio_concurrent_group_key]
 
-    group_name = _get_asyncio_concurrent_group(item)
-    if group_name not in known_groups:
-        known_groups[group_name] = AsyncioConcurrentGroup.from_parent(
+    marker = _get_asyncio_concurrent_mark(item)
+    assert marker is not None
+
+    group_name = _get_asyncio_concurrent_group(item, marker)
+    group = known_groups.get(group_name)
+    if group is None:
+        group = known_groups[group_name] = AsyncioConcurrentGroup.from_parent(
             parent=item.parent, originalname=f"AsyncioConcurrentGroup[{group_name}]"
         )
-    group = known_groups[group_name]
 
     group.add_child(item)
 
@@ -132,8 +190,9 @@ def pytest_itemcollected_register_in_group(item: pytest.Item) -> None:
 def pytest_deselected_update_group(items: Sequence[pytest.Item]) -> None:
     """Remove item from group if deselected."""
     for item in items:
-        if isinstance(item, AsyncioConcurrentGroupMember):
-            item.group.remove_child(item)
+        if _is_asyncio_concurrent_member(item):
+            member = cast(AsyncioConcurrentGroupMember, item)
+            member.group.remove_child(member)
 
 
 # =========================== # pytest_runtestloop # =========================== #
@@ -147,19 +206,33 @@ def pytest_runtestloop_handle_async_by_group(session: pytest.Session) -> Generat
     - Handle async tests by group, one at a time.
     - Ungroup them after everything done.
     """
+    # no group registered on collection, nothing to handle.
+    if not session.config.stash[asyncio_concurrent_group_key]:
+        return (yield)
+
     items = session.items
     ihook = session.ihook
 
-    asyncio_concurrent_tests = [
-        item for item in items if isinstance(item, AsyncioConcurrentGroupMember)
-    ]
-    groups: List[AsyncioConcurrentGroup] = []
-    for async_test in asyncio_concurrent_tests:
-        if async_test.group not in groups:
-            groups.append(async_test.group)
-        items.remove(async_test)
+    asyncio_concurrent_tests: List[AsyncioConcurrentGroupMember] = []
+    other_tests: List[pytest.Item] = []
+    for item in items:
+        if _is_asyncio_concurrent_member(item):
+            asyncio_concurrent_tests.append(cast(AsyncioConcurrentGroupMember, item))
+        else:
+            other_tests.append(item)
+
+    if not asyncio_concurrent_tests:
+        return (yield)
+
+    # rebuild in place in one pass, `items.remove` on each async test is quadratic.
+    items[:] = other_tests
+
+    # dict keeps the first seen order, without scanning a list on every test.
+    groups: List[AsyncioConcurrentGroup] = list(
+        dict.fromkeys(async_test.group for async_test in asyncio_concurrent_tests)
+    )
 
-    assert sum([len(group.children) for group in groups]) == len(asyncio_concurrent_tests)
+    assert sum(len(group.children) for group in groups) == len(asyncio_concurrent_tests)
 
     result = yield
 
@@ -171,8 +244,7 @@ def pytest_runtestloop_handle_async_by_group(session: pytest.Session) -> Generat
         ihook.pytest_runtest_protocol_async_group(group=group, nextgroup=nextgroup)
 
     for group in groups:
-        for item in group.children:
-            items.append(item)
+        items.extend(group.children)
 
     return result
 
@@ -211,49 +283,131 @@ def pytest_runtest_protocol_async_group(
         )
 
     item_passed_setup: List[AsyncioConcurrentGroupMember] = []
-    loop = asyncio.get_event_loop()
+    loop = _get_plugin_loop(group.config)
+    ihooks = _resolve_ihooks(group.children)
+    setup_hook = _hook_skipping_runner(group.config, "pytest_runtest_setup")
+    teardown_hook = _hook_skipping_runner(group.config, "pytest_runtest_teardown")
 
     for childFunc in group.children:
-        childFunc.ihook.pytest_runtest_logstart(
-            nodeid=childFunc.nodeid, location=childFunc.location
-        )
+        ihook = ihooks[childFunc]
+        ihook.pytest_runtest_logstart(nodeid=childFunc.nodeid, location=childFunc.location)
 
-        report = _call_and_report(_setup_child(childFunc), childFunc, "setup")
+        report = _call_and_report(
+            _setup_child(childFunc, ihook, setup_hook), childFunc, "setup", ihook
+        )
         if report.passed:
             item_passed_setup.append(childFunc)
 
-    coros = [_call_runtest_async(childFunc) for childFunc in item_passed_setup]
-    callinfos = loop.run_until_complete(asyncio.gather(*coros))
+    coros = [
+        (childFunc.nodeid, _call_runtest_async(childFunc, ihooks[childFunc]))
+        for childFunc in item_passed_setup
+    ]
+    callinfos = loop.run_until_complete(_gather(coros)) if coros else []
 
     for childFunc, callinfo in zip(item_passed_setup, callinfos):
-        report = childFunc.ihook.pytest_runtest_makereport(item=childFunc, call=callinfo)
+        ihook = ihooks[childFunc]
+        report = ihook.pytest_runtest_makereport(item=childFunc, call=callinfo)
         if _check_interactive_exception(call=callinfo, report=report):
-            childFunc.ihook.pytest_exception_interact(node=childFunc, call=callinfo, report=report)
+            ihook.pytest_exception_interact(node=childFunc, call=callinfo, report=report)
 
-        childFunc.ihook.pytest_runtest_logreport(report=report)
+        ihook.pytest_runtest_logreport(report=report)
 
     for childFunc in group.children:
-        _call_and_report(_teardown_child(childFunc, nextgroup=nextgroup), childFunc, "teardown")
-
-        childFunc.ihook.pytest_runtest_logfinish(
-            nodeid=childFunc.nodeid, location=childFunc.location
+        ihook = ihooks[childFunc]
+        _call_and_report(
+            _teardown_child(childFunc, ihook, teardown_hook, nextgroup=nextgroup),
+            childFunc,
+            "teardown",
+            ihook,
         )
 
+        ihook.pytest_runtest_logfinish(nodeid=childFunc.nodeid, location=childFunc.location)
+
     return True
 
 
-async def _call_runtest_async(item: AsyncioConcurrentGroupMember) -> pytest.CallInfo:
+# referencing CallInfo.from_call
+async def _call_runtest_async(
+    item: AsyncioConcurrentGroupMember, ihook: pluggy.HookRelay
+) -> pytest.CallInfo:
+    """An async version of CallInfo.from_call, calling pytest_runtest_call_async."""
     mark = _get_asyncio_concurrent_mark(item)
     assert mark
     timeout = mark.kwargs.get("timeout")
 
-    return await _async_callinfo_from_call(
-        functools.partial(item.ihook.pytest_runtest_call_async, item=item),  # type: ignore
-        timeout=timeout,
+    excinfo = None
+    start = timing.time()
+    precise_start = timing.perf_counter()
+    try:
+        coro = ihook.pytest_runtest_call_async(item=item)
+        result = await (coro if timeout is None else asyncio.wait_for(coro, timeout=timeout))
+    except BaseException:
+        excinfo = pytest.ExceptionInfo.from_current()
+        if isinstance(excinfo.value, outcomes.Exit) or isinstance(excinfo.value, KeyboardInterrupt):
+            raise
+        result = None
+
+    duration = timing.perf_counter() - precise_start
+    # derive wall clock stop time from duration, saving one more clock read.
+    stop = start + duration
+
+    callInfo: pytest.CallInfo = pytest.CallInfo(
+        start=start,
+        stop=stop,
+        duration=duration,
+        when="call",
+        result=result,
+        excinfo=excinfo,
+        _ispytest=True,
     )
 
+    return callInfo
+
 
-def _setup_child(item: AsyncioConcurrentGroupMember) -> Callable[[], None]:
+async def _gather(
+    coros: List[Tuple[str, Coroutine[Any, Any, pytest.CallInfo]]],
+) -> List[pytest.CallInfo]:
+    """
+    Await all coroutines concurrently, results are returned in the order of given coroutines.
+    Tasks are named after the given names, so they can be told apart when profiling.
+    """
+    if len(coros) == 1:
+        return [await coros[0][1]]
+
+    return list(await asyncio.gather(*_start_tasks(coros)))
+
+
+def _start_tasks(
+    coros: List[Tuple[str, Coroutine[Any, Any, pytest.CallInfo]]],
+) -> List["asyncio.Task[pytest.CallInfo]"]:
+    """
+    Wrap coroutines into tasks. On python 3.12+ tests are started eagerly, only the tasks
+    created here, `asyncio.create_task` inside tests keeps its default behavior.
+    Coroutines not yet wrapped are closed if starting a test aborts, e.g. `KeyboardInterrupt`.
+    """
+    loop = asyncio.get_running_loop()
+    tasks: List["asyncio.Task[pytest.CallInfo]"] = []
+    try:
+        for name, coro in coros:
+            if sys.version_info >= (3, 12):
+                task = asyncio.Task(coro, loop=loop, name=name, eager_start=True)
+            else:
+                task = loop.create_task(coro, name=name)
+            tasks.append(task)
+    except BaseException:
+        started = len(tasks)
+        for _, coro in coros[started:]:
+            coro.close()
+        raise
+
+    return tasks
+
+
+def _setup_child(
+    item: AsyncioConcurrentGroupMember,
+    ihook: pluggy.HookRelay,
+    setup_hook: pluggy.HookCaller,
+) -> Callable[[], None]:
     """
     Setup flow for normal pytest tests:
     - Push all nodes onto `SetupState`, start from furthest.
@@ -270,17 +424,17 @@ def _setup_child(item: AsyncioConcurrentGroupMember) -> Callable[[], None]:
 
     def inner() -> None:
         if not item.group.has_setup:
-            item.ihook.pytest_runtest_setup_async_group(item=item.group)
+            ihook.pytest_runtest_setup_async_group(item=item.group)
 
-        item.config.pluginmanager.subset_hook_caller(
-            "pytest_runtest_setup", [item.config.pluginmanager.get_plugin("runner")]
-        )(item=item)
+        setup_hook(item=item)
 
     return inner
 
 
 def _teardown_child(
     item: AsyncioConcurrentGroupMember,
+    ihook: pluggy.HookRelay,
+    teardown_hook: pluggy.HookCaller,
     nextgroup: Optional[AsyncioConcurrentGroup],
 ) -> Callable[[], None]:
     """
@@ -296,28 +450,36 @@ def _teardown_child(
     """
 
     def inner() -> None:
-        exceptions = []
+        # no list on the happy path, most teardowns raise nothing.
+        child_exc: Optional[Exception] = None
         try:
-            item.config.pluginmanager.subset_hook_caller(
-                "pytest_runtest_teardown", [item.config.pluginmanager.get_plugin("runner")]
-            )(item=item, nextitem=nextgroup)
+            teardown_hook(item=item, nextitem=nextgroup)
         except Exception as e:
-            exceptions.append(e)
+            child_exc = e
 
         try:
             if len(item.group.children_finalizer) == 0:
-                item.ihook.pytest_runtest_teardown_async_group(item=item.group, nextitem=nextgroup)
+                ihook.pytest_runtest_teardown_async_group(item=item.group, nextitem=nextgroup)
         except Exception as e:
-            if isinstance(e, BaseExceptionGroup):
-                exceptions.extend(e.exceptions)  # type: ignore
-            else:
-                exceptions.append(e)
+            if child_exc is None and not isinstance(e, BaseExceptionGroup):
+                raise
+            group_exc = e
+        else:
+            if child_exc is not None:
+                raise child_exc
+            return
+
+        # group errors are flattened and reported under this item.
+        exceptions = [] if child_exc is None else [child_exc]
+        if isinstance(group_exc, BaseExceptionGroup):
+            exceptions.extend(group_exc.exceptions)  # type: ignore
+        else:
+            exceptions.append(group_exc)
 
         if len(exceptions) == 1:
             raise exceptions[0]
-        elif len(exceptions) > 1:
-            msg = f"errors while tearing down {item!r}"
-            raise BaseExceptionGroup(msg, exceptions)
+        msg = f"errors while tearing down {item!r}"
+        raise BaseExceptionGroup(msg, exceptions)
 
     return inner
 
@@ -326,8 +488,12 @@ def _teardown_child(
 
 
 @pytest.hookimpl(specname="pytest_runtest_call_async")
-async def pytest_runtest_call_async(item: pytest.Function) -> object:
-    if not inspect.iscoroutinefunction(item.obj):
+def pytest_runtest_call_async(item: pytest.Function) -> Coroutine[Any, Any, object]:
+    """
+    Preconditions and test arguments are handled synchronously,
+    only the test itself is left in the returned coroutine.
+    """
+    if not _iscoroutinefunction(item.obj):
         warnings.warn(
             PytestAsyncioConcurrentInvalidMarkWarning(
                 "Marking a sync function with @asyncio_concurrent is invalid."
@@ -336,9 +502,18 @@ async def pytest_runtest_call_async(item: pytest.Function) -> object:
 
         pytest.skip("Marking a sync function with @asyncio_concurrent is invalid.")
 
-    with hook_wrapper_entered(item.ihook.pytest_runtest_call, item=item):
-        testfunction = item.obj
-        testargs = {arg: item.funcargs[arg] for arg in item._fixtureinfo.argnames}
+    return _call_testfunction(item, item.obj, _get_testargs(item))
+
+
+async def _call_testfunction(
+    item: pytest.Function,
+    testfunction: Callable[..., Coroutine[Any, Any, object]],
+    testargs: Dict[str, object],
+) -> object:
+    """Shared by all async tests, no closure got created per test."""
+    with hook_wrapper_entered(item, "pytest_runtest_call", item=item):
+        if not testargs:
+            return await testfunction()
         return await testfunction(**testargs)
 
 
@@ -370,7 +545,7 @@ def pytest_runtest_teardown_async_group(
 @pytest.hookimpl(specname="pytest_runtest_setup")
 def pytest_runtest_setup_handle_async_function(item: pytest.Item) -> None:
     """We have skipped the one in pytest.runner, but we still need setup."""
-    if not isinstance(item, AsyncioConcurrentGroupMember):
+    if not _is_asyncio_concurrent_member(item):
         return
 
     item.setup()
@@ -384,10 +559,11 @@ def pytest_runtest_teardown_handle_async_function(
     We have skipped the one in pytest.runner,
     redirecting to AsyncioConcurrentGroup for teardown.
     """
-    if not isinstance(item, AsyncioConcurrentGroupMember):
+    if not _is_asyncio_concurrent_member(item):
         return
 
-    item.group.teardown_child(item)
+    member = cast(AsyncioConcurrentGroupMember, item)
+    member.group.teardown_child(member)
 
 
 # =========================== # Captures #===========================#
@@ -397,28 +573,103 @@ def pytest_runtest_teardown_handle_async_function(
 def pytest_runtest_protocol_async_group_warning(
     group: "AsyncioConcurrentGroup", nextgroup: Optional["AsyncioConcurrentGroup"]
 ) -> Generator[None, object, object]:
-    with hook_wrapper_entered(group.ihook.pytest_runtest_protocol, item=group, nextitem=nextgroup):
+    with hook_wrapper_entered(group, "pytest_runtest_protocol", item=group, nextitem=nextgroup):
         return (yield)
 
 
 # =========================== # helper #===========================#
 
 
+def _is_asyncio_concurrent_member(item: pytest.Item) -> bool:
+    """
+    Called on every items in several hooks, `isinstance` against pytest nodes goes through
+    `ABCMeta.__instancecheck__`, while a class attribute lookup is way cheaper.
+    Callers `cast` the item themselves, since no type narrowing comes with it.
+    """
+    return getattr(item, "is_asyncio_concurrent_member", False)
+
+
+def _get_testargs(item: pytest.Function) -> Dict[str, object]:
+    """Pick test arguments out of `funcargs` in one `itemgetter` call."""
+    argnames = item._fixtureinfo.argnames
+    if not argnames:
+        return {}
+
+    values = operator.itemgetter(*argnames)(item.funcargs)
+    if len(argnames) == 1:
+        return {argnames[0]: values}
+    return dict(zip(argnames, values))
+
+
+def _resolve_ihooks(
+    items: Sequence[AsyncioConcurrentGroupMember],
+) -> Dict[AsyncioConcurrentGroupMember, pluggy.HookRelay]:
+    """
+    `ihook` is resolved from conftest modules applying to the node path on every access,
+    which is the same for children under the same path. So only resolving once per path.
+    """
+    path_ihooks: Dict[Path, pluggy.HookRelay] = {}
+    ihooks: Dict[AsyncioConcurrentGroupMember, pluggy.HookRelay] = {}
+    for item in items:
+        ihook = path_ihooks.get(item.path)
+        if ihook is None:
+            ihook = path_ihooks[item.path] = item.ihook
+        ihooks[item] = ihook
+
+    return ihooks
+
+
+def _hook_skipping_runner(config: pytest.Config, name: str) -> pluggy.HookCaller:
+    """Hook caller skipping the implementation from pytest `runner` plugin."""
+    pluginmanager = config.pluginmanager
+    return pluginmanager.subset_hook_caller(name, [pluginmanager.get_plugin("runner")])
+
+
 def _get_asyncio_concurrent_mark(item: pytest.Item) -> Optional[pytest.Mark]:
-    return item.get_closest_marker("asyncio_concurrent")
+    """Cached on item stash, walking through markers of all parents only once."""
+    if asyncio_concurrent_mark_key not in item.stash:
+        item.stash[asyncio_concurrent_mark_key] = item.get_closest_marker("asyncio_concurrent")
 
+    return item.stash[asyncio_concurrent_mark_key]
 
-def _get_asyncio_concurrent_group(item: AsyncioConcurrentGroupMember) -> str:
-    marker = item.get_closest_marker("asyncio_concurrent")
-    assert marker is not None
 
-    default_group_name = (
-        f"self_[{item.nodeid}]"
-        if _get_group_strategy(item.config) == "self"
-        else f"parent_[{item.parent.nodeid}]"  # type: ignore
-    )
+def _is_marked_on_definition(item: pytest.Function) -> bool:
+    """
+    Whether the asyncio_concurrent mark is visible from the function definition,
+    instead of only coming from `pytest.param(marks=...)`.
+    """
+    if not hasattr(item, "callspec"):
+        return True
 
-    return marker.kwargs.get("group", default_group_name)
+    callspec_marks = item.callspec.marks
+    return any(mark not in callspec_marks for mark in item.iter_markers("asyncio_concurrent"))
+
+
+def _get_asyncio_concurrent_group(item: AsyncioConcurrentGroupMember, marker: pytest.Mark) -> str:
+    group_name = marker.kwargs.get("group")
+    if group_name is not None:
+        return group_name
+
+    # only build the default name when no group provided.
+    if _get_group_strategy(item.config) == "self":
+        return f"self_[{item.nodeid}]"
+    return f"parent_[{item.parent.nodeid}]"  # type: ignore
+
+
+def _iscoroutinefunction(func: object) -> bool:
+    """`inspect.iscoroutinefunction` with a fast path on code flags for plain functions."""
+    code = getattr(func, "__code__", None)
+    if code is None or hasattr(func, "_is_coroutine_marker"):
+        return inspect.iscoroutinefunction(func)
+    return bool(code.co_flags & inspect.CO_COROUTINE)
+
+
+def _isasyncgenfunction(func: object) -> bool:
+    """`inspect.isasyncgenfunction` with a fast path on code flags for plain functions."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return inspect.isasyncgenfunction(func)
+    return bool(code.co_flags & inspect.CO_ASYNC_GENERATOR)
 
 
 @functools.lru_cache(maxsize=1)
@@ -434,38 +685,47 @@ def _get_group_strategy(config: pytest.Config) -> GroupStrategy:
     return cast(GroupStrategy, strategy)
 
 
-# referencing CallInfo.from_call
-async def _async_callinfo_from_call(
-    func: Callable[[], Coroutine], timeout: Optional[int]
-) -> pytest.CallInfo:
-    """An async version of CallInfo.from_call"""
+def _get_plugin_loop(config: pytest.Config) -> asyncio.AbstractEventLoop:
+    """
+    The event loop shared by all async tests and fixtures in this session.
+    Created on first use and set as current event loop, so sync code calling
+    `asyncio.get_event_loop()` gets the same loop as tests.
+    Closed on `pytest_unconfigure`, where the previous current event loop is restored.
+    Being the current event loop, it can be closed by others, e.g. pytest-asyncio,
+    a new one is created in that case.
+    """
+    loop = config.stash.get(asyncio_concurrent_loop_key, None)
+    if loop is None or loop.is_closed():
+        if loop is None:
+            config.stash[asyncio_concurrent_previous_loop_key] = _get_event_loop_no_warn()
+        loop = config.stash[asyncio_concurrent_loop_key] = _new_event_loop(config)
+        asyncio.set_event_loop(loop)
 
-    excinfo = None
-    start = timing.time()
-    precise_start = timing.perf_counter()
-    try:
-        result = await asyncio.wait_for(func(), timeout=timeout)
-    except BaseException:
-        excinfo = pytest.ExceptionInfo.from_current()
-        if isinstance(excinfo.value, outcomes.Exit) or isinstance(excinfo.value, KeyboardInterrupt):
-            raise
-        result = None
+    return loop
 
-    precise_stop = timing.perf_counter()
-    duration = precise_stop - precise_start
-    stop = timing.time()
 
-    callInfo: pytest.CallInfo = pytest.CallInfo(
-        start=start,
-        stop=stop,
-        duration=duration,
-        when="call",
-        result=result,
-        excinfo=excinfo,
-        _ispytest=True,
-    )
+def _get_event_loop_no_warn() -> Optional[asyncio.AbstractEventLoop]:
+    """Current event loop, without the deprecation warning from python 3.12+."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            return asyncio.get_event_loop()
+        except RuntimeError:
+            return None
 
-    return callInfo
+
+def _new_event_loop(config: pytest.Config) -> asyncio.AbstractEventLoop:
+    """Use uvloop only if enabled, installation is checked on `pytest_configure`."""
+    if not _use_uvloop(config):
+        return asyncio.new_event_loop()
+
+    import uvloop
+
+    return uvloop.new_event_loop()
+
+
+def _use_uvloop(config: pytest.Config) -> bool:
+    return bool(config.getoption("--use-uvloop") or config.getini("use_uvloop"))
 
 
 # referencing runner.call_and_report
@@ -473,30 +733,33 @@ def _call_and_report(
     func: Callable[[], None],
     item: pytest.Item,
     when: Literal["setup", "teardown"],
+    ihook: pluggy.HookRelay,
 ) -> pytest.TestReport:
+    """`ihook` is resolved by caller, sharing among items under same path."""
     reraise: tuple[type[BaseException], ...] = (outcomes.Exit,)
     if not item.config.getoption("usepdb", False):
         reraise += (KeyboardInterrupt,)
 
     call = pytest.CallInfo.from_call(func, when=when, reraise=reraise)
-    report: pytest.TestReport = item.ihook.pytest_runtest_makereport(item=item, call=call)
-    item.ihook.pytest_runtest_logreport(report=report)
+    report: pytest.TestReport = ihook.pytest_runtest_makereport(item=item, call=call)
+    ihook.pytest_runtest_logreport(report=report)
 
     if (
         call.excinfo
         and not isinstance(call.excinfo.value, outcomes.Skipped)
         and not hasattr(report, "wasxfail")
     ):
-        item.ihook.pytest_exception_interact(node=item, call=call, report=report)
+        ihook.pytest_exception_interact(node=item, call=call, report=report)
 
     if _check_interactive_exception(call, report):
-        item.ihook.pytest_exception_interact(node=item, call=call, report=report)
+        ihook.pytest_exception_interact(node=item, call=call, report=report)
     return report
 
 
 @contextlib.contextmanager
 def hook_wrapper_entered(
-    hook: pluggy.HookCaller,
+    node: pytest.Item,
+    hookname: str,
     **kwds: Any,
 ) -> Generator[None, None, Any]:
     """
@@ -504,18 +767,31 @@ def hook_wrapper_entered(
     # so reusing defined hooks wrapper here.
     """
     with contextlib.ExitStack() as es:
-        for hookimpl in hook.get_hookimpls():
-            if not hookimpl.wrapper:
-                continue
-            es.enter_context(
-                contextlib.contextmanager(hookimpl.function)(  # type: ignore
-                    **{k: v for k, v in kwds.items() if k in hookimpl.argnames}
-                )
-            )
+        for cm, argnames in _get_hook_wrappers(node, hookname):
+            es.enter_context(cm(**{k: kwds[k] for k in argnames if k in kwds}))
 
         yield
 
 
+def _get_hook_wrappers(node: pytest.Item, hookname: str) -> HookWrappers:
+    """
+    Wrapper implementations of the hook applying to the node, cached by node path.
+    Plugins and conftests are all registered by the time tests running.
+    Wrappers are turned into context manager factories only once as well.
+    """
+    cache = node.config.stash[hook_wrappers_key]
+    key = (hookname, node.path)
+    if key not in cache:
+        hook: pluggy.HookCaller = getattr(node.ihook, hookname)
+        cache[key] = [
+            (contextlib.contextmanager(hookimpl.function), tuple(hookimpl.argnames))
+            for hookimpl in hook.get_hookimpls()
+            if hookimpl.wrapper
+        ]
+
+    return cache[key]
+
+
 # copied from _pytest/runner
 def _check_interactive_exception(call: pytest.CallInfo[object], report: pytest.TestReport) -> bool:
     """Check whether the call raised an exception that should be reported as
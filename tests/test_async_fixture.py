@@ -54,6 +54,121 @@ def test_async_gen_fixture(pytester: pytest.Pytester):
     result.assert_outcomes(passed=1)
 
 
+def test_async_fixture_shared_loop(pytester: pytest.Pytester):
+    """Make sure that async fixtures and tests are running on the same event loop"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="function")
+            async def async_fixture_function():
+                return asyncio.get_running_loop()
+
+            @pytest.fixture(scope="function")
+            async def async_fixture_gen():
+                event = asyncio.Event()
+                yield asyncio.get_running_loop(), event
+                await asyncio.wait_for(event.wait(), 1)
+
+            @pytest.mark.asyncio_concurrent
+            async def test_fixture_async(async_fixture_function, async_fixture_gen):
+                loop, event = async_fixture_gen
+                assert async_fixture_function is asyncio.get_running_loop()
+                assert loop is asyncio.get_running_loop()
+                event.set()
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=1)
+
+
+def test_async_fixture_shared_loop_closed_by_pytest_asyncio(pytester: pytest.Pytester):
+    """
+    Make sure that async fixtures still set up after pytest-asyncio closed the current loop,
+    and keep sharing the loop with tests.
+    """
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="function")
+            async def async_fixture_function():
+                return asyncio.get_running_loop()
+
+            @pytest.fixture(scope="function")
+            async def async_fixture_gen():
+                yield asyncio.get_running_loop()
+
+            def test_sync_gen(async_fixture_gen):
+                assert not async_fixture_gen.is_closed()
+
+            @pytest.mark.asyncio
+            async def test_pytest_asyncio():
+                pass
+
+            def test_sync_function(async_fixture_function):
+                assert not async_fixture_function.is_closed()
+
+            @pytest.mark.asyncio_concurrent
+            async def test_fixture_async(async_fixture_function, async_fixture_gen):
+                assert async_fixture_function is asyncio.get_running_loop()
+                assert async_fixture_gen is asyncio.get_running_loop()
+            """
+        )
+    )
+    # overwrite the conftest
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_default_fixture_loop_scope=function
+        addopts = -p no:sugar
+        """
+    )
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=4)
+
+
+def test_sync_fixture_current_loop(pytester: pytest.Pytester):
+    """Make sure that sync fixtures getting current event loop share the loop with tests"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="module")
+            def future():
+                return asyncio.get_event_loop().create_future()
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_set_future(future):
+                await asyncio.sleep(0.01)
+                future.set_result(1)
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_await_future(future):
+                assert await asyncio.wait_for(future, 1) == 1
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=2)
+
+
 def test_async_function_fixture_sync(pytester: pytest.Pytester):
     """
     Make sure that async function fixture is got wrapped up
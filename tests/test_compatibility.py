@@ -32,3 +32,84 @@ def test_compatibility_with_pytest_asyncio(pytester: pytest.Pytester):
 
     result = pytester.runpytest()
     result.assert_outcomes(passed=2)
+
+
+def test_compatibility_with_pytest_asyncio_closing_loop(pytester: pytest.Pytester):
+    """Make sure tests still run when pytest-asyncio closed the current event loop"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture
+            async def async_fixture():
+                return 1
+
+            def test_sync(async_fixture):
+                assert async_fixture == 1
+
+            @pytest.mark.asyncio
+            async def test_passing():
+                pass
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_concurrent_A():
+                await asyncio.sleep(0)
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_concurrent_B():
+                await asyncio.sleep(0)
+            """
+        )
+    )
+    # overwrite the conftest
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_default_fixture_loop_scope=function
+        addopts = -p no:sugar
+        """
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=4)
+
+
+def test_compatibility_with_pytest_asyncio_closing_loop_unconfigure(pytester: pytest.Pytester):
+    """Make sure session finishes cleanly when pytest-asyncio closed the plugin event loop"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture
+            async def async_fixture():
+                return 1
+
+            def test_sync(async_fixture):
+                assert async_fixture == 1
+
+            @pytest.mark.asyncio
+            async def test_passing():
+                pass
+            """
+        )
+    )
+    # overwrite the conftest
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_default_fixture_loop_scope=function
+        addopts = -p no:sugar
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=2)
+    assert result.ret == 0
+    assert "Event loop is closed" not in result.stderr.str()
+    assert "never awaited" not in result.stderr.str()
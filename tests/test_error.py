@@ -62,3 +62,33 @@ def test_marked_synced_error(pytester: pytest.Pytester):
 
     result = pytester.runpytest()
     result.assert_outcomes(warnings=1, skipped=1, passed=1)
+
+
+def test_exit_in_group(pytester: pytest.Pytester):
+    """Make sure pytest.exit in a group stops the session without leaving tests unawaited"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_A():
+                pytest.exit("exit in group")
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_B():
+                await asyncio.sleep(0)
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_C():
+                await asyncio.sleep(0)
+            """
+        )
+    )
+
+    result = pytester.runpytest_subprocess("-W", "error::RuntimeWarning")
+
+    result.stdout.fnmatch_lines(["*Exit: exit in group*"])
+    assert "never awaited" not in result.stderr.str()
@@ -0,0 +1,98 @@
+from textwrap import dedent
+import pytest
+
+
+FAKE_UVLOOP = dedent(
+    """\
+    import asyncio
+
+    class Loop(asyncio.SelectorEventLoop):
+        pass
+
+    def new_event_loop():
+        return Loop()
+    """
+)
+
+
+def test_uvloop_default_off(pytester: pytest.Pytester):
+    """Make sure uvloop is not used by default, even if it is importable"""
+
+    pytester.makepyfile(uvloop=FAKE_UVLOOP)
+    pytester.syspathinsert()
+    pytester.makepyfile(
+        test_loop=dedent(
+            """\
+            import asyncio
+            import pytest
+            import uvloop
+
+            @pytest.mark.asyncio_concurrent
+            async def test_loop():
+                assert not isinstance(asyncio.get_running_loop(), uvloop.Loop)
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_uvloop_cli(pytester: pytest.Pytester):
+    """Make sure uvloop is used when enabled by cli"""
+
+    pytester.makepyfile(uvloop=FAKE_UVLOOP)
+    pytester.syspathinsert()
+    pytester.makepyfile(
+        test_loop=dedent(
+            """\
+            import asyncio
+            import pytest
+            import uvloop
+
+            @pytest.fixture
+            async def fixture_loop():
+                return asyncio.get_running_loop()
+
+            @pytest.mark.asyncio_concurrent
+            async def test_loop(fixture_loop):
+                assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
+                assert fixture_loop is asyncio.get_running_loop()
+            """
+        )
+    )
+
+    result = pytester.runpytest("--use-uvloop")
+    result.assert_outcomes(passed=1)
+
+
+def test_uvloop_ini(pytester: pytest.Pytester):
+    """Make sure uvloop is used when enabled by ini"""
+
+    pytester.makepyfile(uvloop=FAKE_UVLOOP)
+    pytester.syspathinsert()
+    pytester.makepyfile(
+        test_loop=dedent(
+            """\
+            import asyncio
+            import pytest
+            import uvloop
+
+            @pytest.mark.asyncio_concurrent
+            async def test_loop():
+                assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
+            """
+        )
+    )
+    pytester.makeini(
+        dedent(
+            """\
+            [pytest]
+            addopts = -p no:asyncio
+            use_uvloop = true
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
@@ -273,3 +273,39 @@ def test_fixture_teardown_error_grouping_multi_scope(pytester: pytest.Pytester):
     print(result.outlines)
     assert "fixture_package" in "\n".join(result.outlines)
     assert "fixture_function" in "\n".join(result.outlines)
+
+
+def test_fixture_teardown_error_grouping_reported_on_test(pytester: pytest.Pytester):
+    """
+    Make sure that multiple errors in non-function scoped fixture teardown stage
+    are grouped under the last test tearing them down.
+    """
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="module")
+            def fixture_moduleA():
+                yield
+                raise AssertionError
+
+            @pytest.fixture(scope="module")
+            def fixture_moduleB():
+                yield
+                raise AssertionError
+
+            @pytest.mark.asyncio_concurrent(group="any")
+            async def test_A(fixture_moduleA, fixture_moduleB):
+                pass
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(
+        ["*errors while tearing down <AsyncioConcurrentGroupMember test_A> (2 sub-exceptions)*"]
+    )
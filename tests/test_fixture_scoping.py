@@ -341,3 +341,112 @@ def test_dynamic_fixture_isolation(pytester: pytest.Pytester):
 
     result = pytester.runpytest()
     result.assert_outcomes(passed=3)
+
+
+def test_fixture_isolation_param_marks(pytester: pytest.Pytester):
+    """
+    Make sure that function fixture isolation still holds,
+    when tests are only marked through `pytest.param(marks=...)`.
+    """
+
+    pytester.makeconftest(
+        dedent(
+            """\
+            import pytest
+
+            @pytest.fixture(scope="function")
+            def fixture_function():
+                value = []
+                yield value
+                print(f"teardown fixture_function {value}")
+            """
+        )
+    )
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            concurrent = pytest.mark.asyncio_concurrent(group="any")
+            sequential = pytest.mark.asyncio_concurrent
+
+            @pytest.mark.parametrize(
+                "p",
+                [
+                    pytest.param(1, marks=concurrent),
+                    pytest.param(2, marks=concurrent),
+                    pytest.param(3, marks=sequential),
+                ]
+            )
+            async def test_param_marks(fixture_function, p):
+                await asyncio.sleep(p / 10)
+
+                fixture_function.append(p)
+                assert fixture_function == [p]
+
+            @pytest.mark.parametrize("p", [pytest.param(4, marks=concurrent)])
+            async def test_param_marks_other(fixture_function, p):
+                await asyncio.sleep(p / 10)
+
+                fixture_function.append(p)
+                assert fixture_function == [p]
+
+            @concurrent
+            async def test_definition_mark(fixture_function):
+                fixture_function.append(5)
+                assert fixture_function == [5]
+            """
+        )
+    )
+
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=5)
+    for p in [1, 2, 3, 4, 5]:
+        assert "\n".join(result.outlines).count(f"teardown fixture_function [{p}]") == 1
+
+
+def test_fixture_isolation_class_mark(pytester: pytest.Pytester):
+    """Make sure that function fixture isolation holds, when the mark comes from the class."""
+
+    pytester.makeconftest(
+        dedent(
+            """\
+            import pytest
+
+            @pytest.fixture(scope="function")
+            def fixture_function():
+                value = []
+                yield value
+                print(f"teardown fixture_function {value}")
+            """
+        )
+    )
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group="any")
+            class TestClass:
+                @pytest.mark.parametrize("p", [1, 2, 3])
+                async def test_parametrized(self, fixture_function, p):
+                    await asyncio.sleep(p / 10)
+
+                    fixture_function.append(p)
+                    assert fixture_function == [p]
+
+                async def test_plain(self, fixture_function):
+                    fixture_function.append(4)
+                    assert fixture_function == [4]
+            """
+        )
+    )
+
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=4)
+    for p in [1, 2, 3, 4]:
+        assert "\n".join(result.outlines).count(f"teardown fixture_function [{p}]") == 1
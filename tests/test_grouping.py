@@ -54,6 +54,32 @@ def test_groups_anonymous(pytester: pytest.Pytester):
     result.assert_outcomes(passed=2)
 
 
+def test_groups_none(pytester: pytest.Pytester):
+    """Make sure tests with group=None treated as no group specified"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group=None)
+            async def test_group_none_A():
+                await asyncio.sleep(0.1)
+
+            @pytest.mark.asyncio_concurrent(group=None)
+            async def test_group_none_B():
+                await asyncio.sleep(0.2)
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    assert result.duration >= 0.3
+    result.assert_outcomes(passed=2)
+
+
 def test_groups_same(pytester: pytest.Pytester):
     """Make sure group with same group exceuted together."""
 
@@ -136,3 +162,36 @@ def test_parametrize_with_group(pytester: pytest.Pytester):
 
     result.assert_outcomes(passed=3)
     assert result.duration < 0.3
+
+
+def test_groups_create_task(pytester: pytest.Pytester):
+    """Make sure tasks created inside grouped tests are scheduled, not started eagerly."""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_group_create_task_A():
+                started = []
+
+                async def worker():
+                    started.append(1)
+
+                task = asyncio.create_task(worker())
+                assert started == []
+                await task
+                assert started == [1]
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_group_create_task_B():
+                await asyncio.sleep(0)
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=2)